@@ -11,6 +11,12 @@ def main():
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # uvicorn[standard] ships both: uvloop's C event loop and the
+        # httptools parser beat the asyncio selector + h11 default on
+        # the WebSocket broadcast and preview streaming paths.
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
     )
 
 
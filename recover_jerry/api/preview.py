@@ -1,8 +1,12 @@
 """File preview API endpoint."""
 
 import mimetypes
+import os
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, Response
 
 from ..config import settings
 from ..scanners.registry import get_scanner
@@ -10,6 +14,42 @@ from ..services.scan_manager import scan_manager
 
 router = APIRouter(prefix="/preview", tags=["preview"])
 
+# Pay mimetypes' table initialisation at import, not on the first preview.
+mimetypes.init()
+
+# Fast path for the extensions a thumbnail grid requests constantly.
+_COMMON_MIME = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".heic": "image/heic",
+    ".tiff": "image/tiff",
+    ".bmp": "image/bmp",
+    ".svg": "image/svg+xml",
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".html": "text/html",
+    ".json": "application/json",
+    ".mp4": "video/mp4",
+    ".m4v": "video/x-m4v",
+    ".mov": "video/quicktime",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".wav": "audio/x-wav",
+    ".zip": "application/zip",
+}
+
+
+@lru_cache(maxsize=1024)
+def _guess_mime(extension: str) -> Optional[str]:
+    """MIME type for a lowercased extension; dict fast path first."""
+    mime = _COMMON_MIME.get(extension)
+    if mime:
+        return mime
+    return mimetypes.guess_type(f"f{extension}")[0]
+
 
 @router.get("/{job_id}/{file_id}")
 async def preview_file(job_id: str, file_id: str):
@@ -17,8 +57,7 @@ async def preview_file(job_id: str, file_id: str):
     if not job:
         raise HTTPException(status_code=404, detail="Scan job not found")
 
-    files = scan_manager.get_results(job_id)
-    file = next((f for f in files if f.id == file_id), None)
+    file = scan_manager.get_file(job_id, file_id)
     if not file:
         raise HTTPException(status_code=404, detail="File not found")
 
@@ -26,6 +65,20 @@ async def preview_file(job_id: str, file_id: str):
     if file.metadata.size > settings.max_preview_size_mb * 1024 * 1024:
         raise HTTPException(status_code=413, detail="File too large for preview")
 
+    mime_type = _guess_mime(file.extension_lower) or "application/octet-stream"
+
+    # When the file sits directly on disk, let Starlette serve it with
+    # FileResponse: streamed in chunks (sendfile where available)
+    # instead of materialising up to max_preview_size_mb in one bytes
+    # object on the event loop.
+    if file.access_path and os.path.isfile(file.access_path):
+        return FileResponse(
+            file.access_path,
+            media_type=mime_type,
+            filename=file.filename,
+            content_disposition_type="inline",
+        )
+
     scanner = get_scanner(file.source_id)
     if not scanner:
         raise HTTPException(status_code=500, detail="Scanner not available")
@@ -34,8 +87,6 @@ async def preview_file(job_id: str, file_id: str):
     if data is None:
         raise HTTPException(status_code=404, detail="Could not read file")
 
-    mime_type = mimetypes.guess_type(file.filename)[0] or "application/octet-stream"
-
     return Response(
         content=data,
         media_type=mime_type,
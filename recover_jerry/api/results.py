@@ -23,38 +23,16 @@ async def get_results(
     if not job:
         raise HTTPException(status_code=404, detail="Scan job not found")
 
-    files = scan_manager.get_results(job_id)
-
-    # Filter
-    if search:
-        search_lower = search.lower()
-        files = [f for f in files if search_lower in f.filename.lower() or search_lower in f.original_path.lower()]
-    if extension:
-        ext = extension if extension.startswith(".") else f".{extension}"
-        files = [f for f in files if f.extension.lower() == ext.lower()]
-    if source:
-        files = [f for f in files if f.source_id == source]
-
-    total = len(files)
-
-    # Sort
-    sort_key_map = {
-        "filename": lambda f: f.filename.lower(),
-        "size": lambda f: f.metadata.size,
-        "modified": lambda f: f.metadata.modified or f.metadata.created or "",
-        "created": lambda f: f.metadata.created or "",
-        "extension": lambda f: f.extension.lower(),
-        "source": lambda f: f.source_id,
-    }
-    key_fn = sort_key_map.get(sort_by, sort_key_map["filename"])
-    reverse = sort_order == "desc"
-    try:
-        files = sorted(files, key=key_fn, reverse=reverse)
-    except TypeError:
-        pass
-
-    # Paginate
-    page = files[offset:offset + limit]
+    total, page = scan_manager.query_results(
+        job_id,
+        search=search,
+        extension=extension,
+        source=source,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        offset=offset,
+        limit=limit,
+    )
 
     return {
         "job_id": job_id,
@@ -9,11 +9,16 @@ from fastapi import APIRouter, HTTPException
 from ..models.common import FileMetadata, RecoveredFile
 from ..models.scan import ScanConfig, ScanJob, ScanStatus, ScanProgress
 from ..services.scan_manager import scan_manager
+from ..utils.timestamps import dt_from_ts
 
 router = APIRouter(prefix="/scan", tags=["scan"])
 
 PHOTOREC_OUTPUT_DIR = "/tmp/recover-jerry-carve"
 
+# st_birthtime exists on every stat result or none (macOS yes, Linux no);
+# probe once instead of catching AttributeError per file.
+_HAS_BIRTHTIME = hasattr(os.stat_result, "st_birthtime")
+
 
 @router.post("/start")
 async def start_scan(config: ScanConfig):
@@ -51,43 +56,47 @@ async def load_photorec_results():
     job.status = ScanStatus.COMPLETED
     job.completed_at = datetime.now(tz=timezone.utc)
 
+    # os.scandir returns DirEntry objects whose type/stat come cached
+    # from the directory read — PhotoRec output can exceed a million
+    # files, so the per-entry Path construction and extra stat(2)
+    # syscalls of iterdir dominate this loop.
     files = []
-    for d in sorted(output_path.iterdir()):
-        if not d.is_dir() or not d.name.startswith("recup_dir"):
-            continue
-        for fpath in sorted(d.iterdir()):
-            if not fpath.is_file() or fpath.name.startswith("."):
+    with os.scandir(output_path) as it:
+        recup_dirs = sorted(
+            (e for e in it
+             if e.name.startswith("recup_dir") and e.is_dir(follow_symlinks=False)),
+            key=lambda e: e.name,
+        )
+    for d in recup_dirs:
+        with os.scandir(d.path) as entries:
+            dir_entries = sorted(entries, key=lambda e: e.name)
+        for entry in dir_entries:
+            if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
                 continue
             try:
-                stat = fpath.stat()
+                stat = entry.stat(follow_symlinks=False)
             except OSError:
                 continue
             if stat.st_size == 0:
                 continue
 
-            ext = fpath.suffix.lower() if fpath.suffix else ""
-            created = None
-            modified = None
-            try:
-                created = datetime.fromtimestamp(stat.st_birthtime, tz=timezone.utc)
-            except AttributeError:
-                pass
-            try:
-                modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-            except (OSError, ValueError):
-                pass
+            name = entry.name
+            _, dot, ext_part = name.rpartition(".")
+            ext = f".{ext_part.lower()}" if dot and ext_part else ""
+            created = dt_from_ts(stat.st_birthtime) if _HAS_BIRTHTIME else None
+            modified = dt_from_ts(stat.st_mtime)
 
-            rf = RecoveredFile(
+            rf = RecoveredFile.build(
                 source_id="file_carving",
-                original_path=f"[carved] {fpath.name}",
-                filename=fpath.name,
+                original_path=f"[carved] {name}",
+                filename=name,
                 extension=ext,
-                metadata=FileMetadata(
+                metadata=FileMetadata.build(
                     size=stat.st_size,
                     created=created,
                     modified=modified,
                 ),
-                access_path=str(fpath),
+                access_path=entry.path,
             )
             files.append(rf)
 
@@ -1,14 +1,36 @@
 """System info API endpoints."""
 
+import asyncio
+import time
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from ..services.system_inspector import inspect_system
 from ..scanners.file_carving import set_sudo_password, get_sudo_password, _test_sudo
+from ..utils.permissions import invalidate_permission_caches
 
 router = APIRouter(prefix="/system", tags=["system"])
 
-_cached_info = None
+# inspect_system shells out to diskutil/tmutil/sudo per call, so cache
+# the result briefly and hold a lock so concurrent first requests (or a
+# polling dashboard) coalesce into a single inspection.
+_CACHE_TTL = 5.0
+
+
+class _SystemInfoCache:
+    def __init__(self):
+        self.value = None
+        self.expires_at = 0.0
+        self.lock = asyncio.Lock()
+
+    async def refresh(self, force_scanners: bool = False):
+        self.value = await inspect_system(force_refresh=force_scanners)
+        self.expires_at = time.monotonic() + _CACHE_TTL
+        return self.value
+
+
+_cache = _SystemInfoCache()
 
 
 class SudoRequest(BaseModel):
@@ -17,17 +39,16 @@ class SudoRequest(BaseModel):
 
 @router.get("/info")
 async def get_system_info():
-    global _cached_info
-    if _cached_info is None:
-        _cached_info = await inspect_system()
-    return _cached_info
+    async with _cache.lock:
+        if _cache.value is not None and time.monotonic() < _cache.expires_at:
+            return _cache.value
+        return await _cache.refresh()
 
 
 @router.post("/refresh")
 async def refresh_system_info():
-    global _cached_info
-    _cached_info = await inspect_system()
-    return _cached_info
+    async with _cache.lock:
+        return await _cache.refresh(force_scanners=True)
 
 
 @router.post("/sudo")
@@ -37,9 +58,11 @@ async def authenticate_sudo(req: SudoRequest):
     if not valid:
         raise HTTPException(status_code=401, detail="Invalid sudo password")
     set_sudo_password(req.password)
-    # Refresh system info to update source availability
-    global _cached_info
-    _cached_info = await inspect_system()
+    # Refresh system info to update source availability; the
+    # permission TTL caches would otherwise serve the pre-auth answer
+    invalidate_permission_caches()
+    async with _cache.lock:
+        await _cache.refresh(force_scanners=True)
     return {"authenticated": True}
 
 
@@ -7,35 +7,105 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from ..services.scan_manager import scan_manager
 from ..services.recovery_manager import recovery_manager
 
+try:
+    import orjson  # optional: compiled serialiser for the broadcast hot path
+except ImportError:
+    orjson = None
+
 router = APIRouter(tags=["websocket"])
 
 
+def _dumps(obj: dict) -> str:
+    """Serialise a WS payload. orjson is 5-10x faster than stdlib json
+    on the small progress dicts broadcast per tick."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# How often coalesced progress updates are flushed to clients (~30 Hz).
+_FLUSH_INTERVAL = 0.033
+
+
 class ConnectionManager:
+    """Fans progress updates out to WebSocket clients.
+
+    Publishing is a synchronous dict-set: successive updates for the
+    same (type, job_id) overwrite each other, and a single background
+    task drains the latest values at a bounded frame rate. High-volume
+    scans no longer head-of-line block the event loop on slow clients,
+    and send syscalls drop to at most one per stream per frame.
+    """
+
     def __init__(self):
-        self.active: list[WebSocket] = []
+        # Copy-on-write: connect/disconnect swap in a new tuple (always
+        # on the event loop thread), so the flush path iterates the
+        # current snapshot without cloning a list per frame.
+        self._clients: tuple[WebSocket, ...] = ()
+        self._latest: dict[tuple[str, str], str] = {}
+        self._flush_task: asyncio.Task | None = None
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        self.active.append(ws)
+        self._clients = self._clients + (ws,)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
 
     def disconnect(self, ws: WebSocket):
-        if ws in self.active:
-            self.active.remove(ws)
+        if ws in self._clients:
+            self._clients = tuple(c for c in self._clients if c is not ws)
 
-    async def broadcast(self, message: dict):
-        for ws in list(self.active):
-            try:
-                await ws.send_json(message)
-            except Exception:
-                self.disconnect(ws)
+    def publish(self, kind: str, job_id: str, payload: str) -> None:
+        """Queue the latest payload for (kind, job_id). No await."""
+        self._latest[(kind, job_id)] = payload
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(_FLUSH_INTERVAL)
+            clients = self._clients
+            if not clients:
+                # Last client left; drop anything pending and exit.
+                self._latest.clear()
+                return
+            if not self._latest:
+                continue
+            pending = list(self._latest.values())
+            self._latest.clear()
+            for payload in pending:
+                results = await asyncio.gather(
+                    *(ws.send_text(payload) for ws in clients),
+                    return_exceptions=True,
+                )
+                for ws, res in zip(clients, results):
+                    if isinstance(res, Exception):
+                        self.disconnect(ws)
 
 
 manager = ConnectionManager()
 
 
+async def _scan_cb(job):
+    manager.publish("scan_progress", job.id, _dumps({
+        "type": "scan_progress",
+        "job_id": job.id,
+        "status": job.status.value,
+        "progress": job.progress.model_dump(mode="python"),
+    }))
+
+
+async def _recovery_cb(job):
+    manager.publish("recovery_progress", job.id, _dumps({
+        "type": "recovery_progress",
+        "job_id": job.id,
+        "status": job.status.value,
+        "progress": job.progress.model_dump(mode="python"),
+    }))
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await manager.connect(ws)
+    subscribed: set[tuple[str, str]] = set()
 
     try:
         while True:
@@ -49,27 +119,16 @@ async def websocket_endpoint(ws: WebSocket):
 
             if action == "subscribe_scan":
                 job_id = msg.get("job_id")
-                if job_id:
-                    async def scan_cb(job):
-                        await manager.broadcast({
-                            "type": "scan_progress",
-                            "job_id": job.id,
-                            "status": job.status.value,
-                            "progress": job.progress.model_dump(),
-                        })
-                    scan_manager.add_progress_listener(job_id, scan_cb)
+                # Guard against duplicate listeners on repeated subscribes
+                if job_id and ("scan", job_id) not in subscribed:
+                    subscribed.add(("scan", job_id))
+                    scan_manager.add_progress_listener(job_id, _scan_cb)
 
             elif action == "subscribe_recovery":
                 job_id = msg.get("job_id")
-                if job_id:
-                    async def recovery_cb(job):
-                        await manager.broadcast({
-                            "type": "recovery_progress",
-                            "job_id": job.id,
-                            "status": job.status.value,
-                            "progress": job.progress.model_dump(),
-                        })
-                    recovery_manager.add_progress_listener(job_id, recovery_cb)
+                if job_id and ("recovery", job_id) not in subscribed:
+                    subscribed.add(("recovery", job_id))
+                    recovery_manager.add_progress_listener(job_id, _recovery_cb)
 
     except WebSocketDisconnect:
         manager.disconnect(ws)
@@ -1,9 +1,10 @@
 """Core shared models."""
 
+import os
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 from pydantic import BaseModel, Field
-import uuid
 
 
 class DateRange(BaseModel):
@@ -19,12 +20,51 @@ class FileMetadata(BaseModel):
     deleted_date: Optional[datetime] = None
     mime_type: Optional[str] = None
 
+    @classmethod
+    def build(cls, **kwargs) -> "FileMetadata":
+        """Construct without validation — for trusted scanner-internal data."""
+        return cls.model_construct(**kwargs)
+
+    @cached_property
+    def best_date(self) -> Optional[datetime]:
+        """Most relevant date, waterfall: deleted > modified > created > accessed.
+
+        Cached: filtering, sorting and export all re-ask the same
+        immutable metadata for its best date.
+        """
+        return self.deleted_date or self.modified or self.created or self.accessed
+
 
 class RecoveredFile(BaseModel):
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
+    # os.urandom(6).hex() gives the same 12-hex-char id as the previous
+    # uuid4().hex[:12] but with a single 6-byte read and no UUID object.
+    id: str = Field(default_factory=lambda: os.urandom(6).hex())
     source_id: str
     original_path: str
     filename: str
     extension: str = ""
     metadata: FileMetadata = Field(default_factory=FileMetadata)
     access_path: str = ""  # internal: where to actually read the file
+
+    @classmethod
+    def build(cls, **kwargs) -> "RecoveredFile":
+        """Construct without validation — for trusted scanner-internal data.
+
+        Validation costs ~1-2 µs per object, which is seconds of pure
+        model overhead across millions of carved files.
+        """
+        return cls.model_construct(**kwargs)
+
+    @cached_property
+    def search_blob(self) -> str:
+        """Lowercased filename + path, computed once per file.
+
+        Search filters are case-insensitive substring matches over both
+        fields; lowering them per query costs 2N str.lower calls per
+        keystroke of a live search on large result sets.
+        """
+        return (self.filename + "\x00" + self.original_path).lower()
+
+    @cached_property
+    def extension_lower(self) -> str:
+        return self.extension.lower()
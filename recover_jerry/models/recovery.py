@@ -41,6 +41,7 @@ class RecoveryFileResult(BaseModel):
     success: bool = False
     error: Optional[str] = None
     checksum_match: Optional[bool] = None
+    checksum_algorithm: Optional[str] = None  # "blake3" or "sha256"
 
 
 class RecoveryJob(BaseModel):
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 from pydantic import BaseModel, Field
 import uuid
@@ -24,6 +25,14 @@ class ScanConfig(BaseModel):
     file_extensions: list[str] = Field(default_factory=list)  # e.g. [".jpg", ".pdf"]
     volume: str = "/"
 
+    @cached_property
+    def normalized_extensions(self) -> frozenset[str]:
+        """file_extensions lowercased and dot-prefixed, computed once."""
+        return frozenset(
+            e.lower() if e.startswith(".") else f".{e.lower()}"
+            for e in self.file_extensions
+        )
+
 
 class ScanProgress(BaseModel):
     current_source: str = ""
@@ -1,14 +1,55 @@
 """Copy files to destination with verification."""
 
+import asyncio
+import ctypes
+import ctypes.util
+import fcntl
 import hashlib
 import os
 import shutil
+import threading
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
 from ..models.common import RecoveredFile
 from ..models.recovery import RecoveryFileResult
 
+try:
+    import blake3  # optional: SIMD + multi-threaded hashing
+except ImportError:
+    blake3 = None
+
+_COPY_BUFSIZE = 1024 * 1024
+
+# Files are dispatched in slices this large so a huge job doesn't
+# materialise one Task object per file upfront
+_TASK_BATCH = 512
+
+
+def _load_clonefile():
+    """Bind macOS clonefile(2), which makes an O(1) copy-on-write clone
+    on APFS — zero data motion when source and destination share a
+    volume. Returns None where the symbol doesn't exist (non-macOS)."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        return libc.clonefile
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+_clonefile = _load_clonefile()
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel to prime readahead for a sequential read."""
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        elif hasattr(fcntl, "F_RDAHEAD"):
+            fcntl.fcntl(fd, fcntl.F_RDAHEAD, 1)
+    except OSError:
+        pass
+
 
 class RecoveryEngine:
     def __init__(
@@ -16,22 +57,59 @@ class RecoveryEngine:
         destination: str,
         preserve_structure: bool = True,
         verify_checksums: bool = True,
+        max_workers: int = 8,
     ):
         self.destination = Path(destination)
         self.preserve_structure = preserve_structure
         self.verify_checksums = verify_checksums
+        self.max_workers = max_workers
 
     async def recover_files(
         self, files: list[RecoveredFile]
     ) -> AsyncIterator[RecoveryFileResult]:
-        """Recover files, yielding results as each completes."""
+        """Recover files, yielding results as each completes.
+
+        Copies run in worker threads so the event loop stays responsive,
+        with a semaphore bounding in-flight copies to keep the disk queue
+        full without thrashing. Files are dispatched in _TASK_BATCH
+        slices: with max_workers copies in flight only a batch's worth
+        of Task objects exist at once, instead of one per file on a
+        100k-file job.
+        """
         self.destination.mkdir(parents=True, exist_ok=True)
 
-        for file in files:
-            result = await self._recover_one(file)
-            yield result
+        sem = asyncio.Semaphore(self.max_workers)
+        # Destination paths claimed by in-flight copies, so concurrent
+        # files with colliding names don't pick the same unique path.
+        # The lock makes check-and-claim atomic across worker threads.
+        claimed: set[str] = set()
+        claim_lock = threading.Lock()
 
-    async def _recover_one(self, file: RecoveredFile) -> RecoveryFileResult:
+        async def worker(file: RecoveredFile) -> RecoveryFileResult:
+            async with sem:
+                return await asyncio.to_thread(
+                    self._recover_one, file, claimed, claim_lock
+                )
+
+        tasks: list[asyncio.Task] = []
+        try:
+            for start in range(0, len(files), _TASK_BATCH):
+                tasks = [
+                    asyncio.create_task(worker(f))
+                    for f in files[start:start + _TASK_BATCH]
+                ]
+                for task in asyncio.as_completed(tasks):
+                    yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _recover_one(
+        self,
+        file: RecoveredFile,
+        claimed: Optional[set[str]] = None,
+        claim_lock: Optional[threading.Lock] = None,
+    ) -> RecoveryFileResult:
         """Recover a single file."""
         source = Path(file.access_path)
         result = RecoveryFileResult(
@@ -48,26 +126,36 @@ class RecoveryEngine:
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Handle name collisions
-            dest_path = self._unique_path(dest_path)
-
-            # Compute source checksum before copy
-            source_hash = None
-            if self.verify_checksums:
-                source_hash = self._sha256(source)
+            dest_path = self._unique_path(dest_path, claimed, claim_lock)
 
-            # Copy the file
-            shutil.copy2(str(source), str(dest_path))
+            if self._try_clone(source, dest_path):
+                # Copy-on-write clone: the destination shares the
+                # source's data blocks, so the bytes are identical by
+                # construction and hashing would only re-read them.
+                result.recovered_path = str(dest_path)
+                result.success = True
+                if self.verify_checksums:
+                    result.checksum_match = True
+            elif self.verify_checksums:
+                # Copy and hash the source in a single pass, then re-read
+                # only the destination to verify. Two passes over the
+                # bytes instead of the three separate reads that
+                # hash-copy-hash would cost.
+                result.checksum_algorithm, source_hash = self._copy_and_hash(
+                    source, dest_path
+                )
+                result.recovered_path = str(dest_path)
+                result.success = True
 
-            result.recovered_path = str(dest_path)
-            result.success = True
-
-            # Verify
-            if self.verify_checksums and source_hash:
-                dest_hash = self._sha256(dest_path)
+                _, dest_hash = self._hash(dest_path)
                 result.checksum_match = (source_hash == dest_hash)
                 if not result.checksum_match:
                     result.error = "Checksum mismatch after copy"
                     result.success = False
+            else:
+                shutil.copy2(str(source), str(dest_path))
+                result.recovered_path = str(dest_path)
+                result.success = True
 
         except PermissionError as e:
             result.error = f"Permission denied: {e}"
@@ -94,26 +182,90 @@ class RecoveryEngine:
         else:
             return self.destination / file.filename
 
-    def _unique_path(self, path: Path) -> Path:
-        """If path exists, add a numeric suffix."""
-        if not path.exists():
-            return path
-        stem = path.stem
-        suffix = path.suffix
-        parent = path.parent
-        counter = 1
-        while True:
-            new_path = parent / f"{stem}_{counter}{suffix}"
-            if not new_path.exists():
-                return new_path
-            counter += 1
-
-    def _sha256(self, path: Path) -> str:
-        h = hashlib.sha256()
-        with open(path, "rb") as f:
+    def _unique_path(
+        self,
+        path: Path,
+        claimed: Optional[set[str]] = None,
+        claim_lock: Optional[threading.Lock] = None,
+    ) -> Path:
+        """If path exists (or is claimed by an in-flight copy), add a numeric suffix.
+
+        The lock is held across the taken() test and the claim: the
+        exists() stat releases the GIL, so without it two worker
+        threads copying same-named files could both claim one
+        destination and silently overwrite each other.
+        """
+        def taken(p: Path) -> bool:
+            return p.exists() or (claimed is not None and str(p) in claimed)
+
+        if claim_lock is None:
+            claim_lock = threading.Lock()
+
+        with claim_lock:
+            if not taken(path):
+                if claimed is not None:
+                    claimed.add(str(path))
+                return path
+            stem = path.stem
+            suffix = path.suffix
+            parent = path.parent
+            counter = 1
             while True:
-                chunk = f.read(65536)
-                if not chunk:
+                new_path = parent / f"{stem}_{counter}{suffix}"
+                if not taken(new_path):
+                    if claimed is not None:
+                        claimed.add(str(new_path))
+                    return new_path
+                counter += 1
+
+    def _try_clone(self, source: Path, dest: Path) -> bool:
+        """Attempt a same-volume APFS clone; False means fall back to copying."""
+        if _clonefile is None:
+            return False
+        try:
+            if os.stat(source).st_dev != os.stat(dest.parent).st_dev:
+                return False
+        except OSError:
+            return False
+        rc = _clonefile(os.fsencode(source), os.fsencode(dest), 0)
+        return rc == 0
+
+    def _copy_and_hash(self, source: Path, dest: Path) -> tuple[str, str]:
+        """Copy source to dest while hashing the stream.
+
+        Each buffer is fed to the hasher and written to dest in the same
+        iteration, so the source is read exactly once. Metadata is
+        preserved afterwards the same way shutil.copy2 would.
+        """
+        algorithm, h = self._new_hasher()
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            _advise_sequential(src.fileno())
+            while True:
+                buf = src.read(_COPY_BUFSIZE)
+                if not buf:
                     break
-                h.update(chunk)
-        return h.hexdigest()
+                h.update(buf)
+                dst.write(buf)
+        shutil.copystat(str(source), str(dest))
+        return algorithm, h.hexdigest()
+
+    def _new_hasher(self) -> tuple[str, "hashlib._Hash"]:
+        if blake3 is not None:
+            return "blake3", blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return "sha256", hashlib.sha256()
+
+    def _hash(self, path: Path) -> tuple[str, str]:
+        """Hash a file, returning (algorithm, hexdigest).
+
+        Prefers BLAKE3 when installed: its mmap + multi-threaded path runs
+        at >1 GB/s per core versus ~400 MB/s for scalar SHA-256, which
+        matters because verification hashes every byte twice. Falls back to
+        hashlib.file_digest, which releases the GIL and uses a larger
+        internal buffer than a Python-level read loop.
+        """
+        if blake3 is not None:
+            h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            h.update_mmap(os.fspath(path))
+            return "blake3", h.hexdigest()
+        with open(path, "rb") as f:
+            return "sha256", hashlib.file_digest(f, "sha256").hexdigest()
@@ -1,5 +1,6 @@
 """Abstract base scanner interface."""
 
+import time
 from abc import ABC, abstractmethod
 from typing import AsyncIterator, Callable, Optional
 
@@ -7,6 +8,12 @@ from ..models.common import RecoveredFile
 from ..models.scan import ScanConfig, ScanProgress
 from ..models.system import SourceAvailability
 
+# Availability answers (does Trash exist, is tmutil configured, ...)
+# change rarely but cost a directory walk or subprocess each; cache
+# them per source so a polling dashboard doesn't re-run the probes.
+_AVAIL_CACHE: dict[str, tuple[float, SourceAvailability]] = {}
+_AVAIL_CACHE_TTL = 60.0
+
 
 class BaseScanner(ABC):
     """All scanners implement this interface."""
@@ -24,6 +31,22 @@ class BaseScanner(ABC):
         """Check whether this scanner source is usable on this system."""
         ...
 
+    async def check_availability_cached(
+        self, force_refresh: bool = False
+    ) -> SourceAvailability:
+        """check_availability with a short per-source TTL cache.
+
+        force_refresh bypasses the cache — used after state changes the
+        probes should pick up immediately (e.g. sudo auth).
+        """
+        if not force_refresh:
+            cached = _AVAIL_CACHE.get(self.source_id)
+            if cached is not None and time.monotonic() - cached[0] < _AVAIL_CACHE_TTL:
+                return cached[1]
+        avail = await self.check_availability()
+        _AVAIL_CACHE[self.source_id] = (time.monotonic(), avail)
+        return avail
+
     @abstractmethod
     async def scan(
         self,
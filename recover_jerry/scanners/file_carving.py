@@ -2,12 +2,14 @@
 
 import asyncio
 import logging
+import operator
 import os
+import re
 import shutil
 import tempfile
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import AsyncIterator, Callable, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Iterator, Optional
 
 from ..models.common import FileMetadata, RecoveredFile
 from ..models.scan import ScanConfig
@@ -17,6 +19,15 @@ from .registry import register_scanner
 
 logger = logging.getLogger(__name__)
 
+# PhotoRec file-family names enabled per UI file-type category
+_TYPE_EXTS: dict[str, tuple[str, ...]] = {
+    "image": ("jpg", "png", "gif", "bmp", "tif", "raw", "cr2", "heic"),
+    "document": ("pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx", "odt", "rtf", "txt"),
+    "video": ("mov", "mp4", "avi", "mkv"),
+    "audio": ("mp3", "wav", "aac", "flac", "m4a", "aif", "ogg"),
+    "code": ("py", "js", "html", "json", "xml"),
+}
+
 # Singleton to hold sudo password for the session
 _sudo_password: Optional[str] = None
 
@@ -30,19 +41,43 @@ def get_sudo_password() -> Optional[str]:
     return _sudo_password
 
 
+@lru_cache(maxsize=1)
 def _find_photorec() -> Optional[str]:
     return shutil.which("photorec")
 
 
+@lru_cache(maxsize=1)
 def _get_data_volume_device() -> Optional[str]:
     """Find the physical disk device for the APFS container holding user data.
 
     On macOS, synthesized APFS volumes (disk3s1 etc.) are 'Resource busy'
     when mounted. PhotoRec needs the physical store device (disk0s2).
+
+    Memoised for the process lifetime: the PATH lookup and especially
+    the diskutil subprocesses (hundreds of ms) are re-run by every
+    availability check otherwise. Use .cache_clear() if the disk layout
+    genuinely changes mid-session.
     """
     import subprocess
 
-    # Strategy 1: Find the APFS physical store for the data volume
+    # Strategy 1: scan the human-readable `diskutil apfs list` output
+    # for the physical store line. The -plist variant can run to
+    # megabytes on systems with many volumes/snapshots, and plistlib
+    # builds the whole nested object graph just to reach one field.
+    try:
+        result = subprocess.run(
+            ["diskutil", "apfs", "list"],
+            capture_output=True, text=True, timeout=10,
+        )
+        if result.returncode == 0:
+            match = re.search(r"Physical Store (disk\d+s\d+)", result.stdout)
+            if match:
+                return f"/dev/{match.group(1)}"
+    except Exception:
+        pass
+
+    # Strategy 2: full plist parse, kept as a fallback in case the text
+    # layout changes across macOS releases
     try:
         result = subprocess.run(
             ["diskutil", "apfs", "list", "-plist"],
@@ -65,7 +100,7 @@ def _get_data_volume_device() -> Optional[str]:
     except Exception:
         pass
 
-    # Strategy 2: Parse diskutil list for the physical disk
+    # Strategy 3: Parse diskutil list for the physical disk
     try:
         result = subprocess.run(
             ["diskutil", "list"], capture_output=True, text=True, timeout=10,
@@ -112,6 +147,11 @@ class FileCarvingScanner(BaseScanner):
         self._output_base: Optional[str] = None
         self._output_dir: Optional[str] = None
         self._process: Optional[asyncio.subprocess.Process] = None
+        self._stdout_tail: bytes = b""
+        # Incremental progress-count caches: recup_dir path -> last
+        # observed entry count / mtime (see _count_recovered_files)
+        self._last_counts: dict[str, int] = {}
+        self._last_mtimes: dict[str, float] = {}
 
     @property
     def requires_sudo(self) -> bool:
@@ -181,6 +221,8 @@ class FileCarvingScanner(BaseScanner):
         tmp_base = tempfile.mkdtemp(prefix="recover-jerry-carve-")
         self._output_base = tmp_base  # PhotoRec will create <tmp_base>.1/
         self._output_dir = f"{tmp_base}.1"  # Where files actually end up
+        self._last_counts.clear()
+        self._last_mtimes.clear()
 
         if progress_callback:
             progress_callback(f"Starting PhotoRec on {device}...")
@@ -201,17 +243,12 @@ class FileCarvingScanner(BaseScanner):
             cmd_parts.append("fileopt")
             cmd_parts.append("everything")
             cmd_parts.append("disable")
-            type_exts = {
-                "image": ["jpg", "png", "gif", "bmp", "tif", "raw", "cr2", "heic"],
-                "document": ["pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx", "odt", "rtf", "txt"],
-                "video": ["mov", "mp4", "avi", "mkv"],
-                "audio": ["mp3", "wav", "aac", "flac", "m4a", "aif", "ogg"],
-                "code": ["py", "js", "html", "json", "xml"],
+            # Set-dedupe in case categories ever share extensions;
+            # sorted keeps the command string deterministic
+            enabled = {
+                ext for ft in config.file_types for ext in _TYPE_EXTS.get(ft, ())
             }
-            for ft in config.file_types:
-                for ext in type_exts.get(ft, []):
-                    cmd_parts.append(ext)
-                    cmd_parts.append("enable")
+            cmd_parts.extend(x for ext in sorted(enabled) for x in (ext, "enable"))
         else:
             cmd_parts.append("fileopt")
             cmd_parts.append("everything")
@@ -248,6 +285,12 @@ class FileCarvingScanner(BaseScanner):
             await self._process.stdin.drain()
             self._process.stdin.close()
 
+            # PhotoRec writes progress to stdout for the whole run; with
+            # no reader the 64 KB pipe fills and PhotoRec blocks,
+            # stalling the carve. Drain continuously in the background,
+            # keeping only a short tail for the exit log.
+            drain_task = asyncio.create_task(self._drain_stdout())
+
             # Monitor progress
             last_count = 0
             while True:
@@ -263,23 +306,20 @@ class FileCarvingScanner(BaseScanner):
                                 f"PhotoRec scanning... {count} files recovered so far"
                             )
 
-            # Read any remaining output
-            remaining_output = b""
-            try:
-                remaining_output = await self._process.stdout.read()
-            except Exception:
-                pass
+            await drain_task
             logger.info(
                 f"PhotoRec exited with code {self._process.returncode}. "
-                f"Output tail: {remaining_output[-500:].decode('utf-8', errors='replace')}"
+                f"Output tail: {self._stdout_tail.decode('utf-8', errors='replace')}"
             )
 
             total = self._count_recovered_files()
             if progress_callback:
                 progress_callback(f"PhotoRec finished. {total} files carved. Processing results...")
 
-            # Collect results
-            for rf in self._collect_results(config):
+            # Stream results straight from the output tree — no
+            # intermediate list, so downstream consumers start seeing
+            # files immediately and memory stays O(1) in carve size.
+            for rf in self._iter_results():
                 yield rf
 
         except Exception as e:
@@ -288,59 +328,117 @@ class FileCarvingScanner(BaseScanner):
                 progress_callback(f"PhotoRec error: {e}")
 
     async def read_file_bytes(self, file: RecoveredFile) -> Optional[bytes]:
+        # One open() replaces the exists/is_file/read_bytes triple —
+        # the kernel checks existence and type atomically.
         try:
-            p = Path(file.access_path)
-            if p.exists() and p.is_file():
-                return p.read_bytes()
-        except (PermissionError, OSError):
+            with open(file.access_path, "rb") as f:
+                return f.read()
+        except (IsADirectoryError, OSError):
+            return None
+
+    async def _drain_stdout(self) -> None:
+        tail = b""
+        try:
+            while True:
+                chunk = await self._process.stdout.read(4096)
+                if not chunk:
+                    break
+                tail = (tail + chunk)[-500:]
+        except Exception:
             pass
-        return None
+        self._stdout_tail = tail
 
-    def _get_output_files(self) -> list[Path]:
-        """Find all recovered files in PhotoRec output.
+    def _iter_output_files(self) -> Iterator[tuple[os.DirEntry, os.stat_result]]:
+        """Yield (DirEntry, stat_result) pairs for PhotoRec output files.
 
         PhotoRec may place files:
         - Directly in the output dir (e.g. <base>.1/)
         - In recup_dir.N subdirectories
+
+        Streams one directory listing at a time (os.scandir, sorted by
+        entry name for deterministic order) instead of materialising the
+        whole tree as a list of Paths. The stat comes from the
+        DirEntry's cache, so consumers filter on size without another
+        syscall.
         """
         if not self._output_dir:
-            return []
-
-        output_path = Path(self._output_dir)
-        if not output_path.exists():
-            return []
-
-        result = []
+            return
         try:
-            for entry in output_path.iterdir():
-                if entry.is_file() and not entry.name.startswith(".") and entry.name != "report.xml":
-                    result.append(entry)
-                elif entry.is_dir() and entry.name.startswith("recup_dir"):
-                    try:
-                        for f in entry.iterdir():
-                            if f.is_file() and not f.name.startswith("."):
-                                result.append(f)
-                    except PermissionError:
-                        pass
-        except PermissionError:
-            pass
+            with os.scandir(self._output_dir) as it:
+                entries = sorted(it, key=operator.attrgetter("name"))
+        except OSError:
+            return
 
-        return result
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name != "report.xml":
+                        yield entry, entry.stat(follow_symlinks=False)
+                    continue
+                if not (entry.is_dir(follow_symlinks=False)
+                        and entry.name.startswith("recup_dir")):
+                    continue
+            except OSError:
+                continue
+            try:
+                with os.scandir(entry.path) as sub:
+                    sub_entries = sorted(sub, key=operator.attrgetter("name"))
+            except OSError:
+                continue
+            for f in sub_entries:
+                try:
+                    if f.is_file(follow_symlinks=False) and not f.name.startswith("."):
+                        yield f, f.stat(follow_symlinks=False)
+                except OSError:
+                    continue
 
     def _count_recovered_files(self) -> int:
-        return len(self._get_output_files())
-
-    def _collect_results(self, config: ScanConfig) -> list[RecoveredFile]:
-        files = []
-        for fpath in sorted(self._get_output_files()):
+        """Count carved files for progress reporting, incrementally.
+
+        PhotoRec appends to one recup_dir at a time, so between two
+        polls almost every subdirectory is untouched. Re-listing a
+        subdirectory only when its mtime changed keeps each poll at
+        O(changed dirs) instead of re-walking the whole output tree —
+        which near the end of a big scan costs tens of thousands of
+        stats per poll.
+        """
+        if not self._output_dir:
+            return 0
+        total = 0
+        try:
+            with os.scandir(self._output_dir) as it:
+                entries = list(it)
+        except OSError:
+            return 0
+        for entry in entries:
             try:
-                stat = fpath.stat()
+                if entry.is_file(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name != "report.xml":
+                        total += 1
+                    continue
+                if not (entry.is_dir(follow_symlinks=False)
+                        and entry.name.startswith("recup_dir")):
+                    continue
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+                if self._last_mtimes.get(entry.path) != mtime:
+                    self._last_counts[entry.path] = sum(
+                        1 for name in os.listdir(entry.path)
+                        if not name.startswith(".")
+                    )
+                    self._last_mtimes[entry.path] = mtime
+                total += self._last_counts[entry.path]
             except OSError:
                 continue
+        return total
+
+    def _iter_results(self) -> Iterator[RecoveredFile]:
+        for entry, stat in self._iter_output_files():
             if stat.st_size == 0:
                 continue
 
-            ext = fpath.suffix.lower() if fpath.suffix else ""
+            name = entry.name
+            _, dot, ext_part = name.rpartition(".")
+            ext = f".{ext_part.lower()}" if dot and ext_part else ""
 
             created = None
             modified = None
@@ -353,21 +451,18 @@ class FileCarvingScanner(BaseScanner):
             except (OSError, ValueError):
                 pass
 
-            rf = RecoveredFile(
+            yield RecoveredFile.build(
                 source_id=self.source_id,
-                original_path=f"[carved] {fpath.name}",
-                filename=fpath.name,
+                original_path=f"[carved] {name}",
+                filename=name,
                 extension=ext,
-                metadata=FileMetadata(
+                metadata=FileMetadata.build(
                     size=stat.st_size,
                     created=created,
                     modified=modified,
                 ),
-                access_path=str(fpath),
+                access_path=entry.path,
             )
-            files.append(rf)
-
-        return files
 
     async def cleanup(self):
         if self._process and self._process.returncode is None:
@@ -1,10 +1,15 @@
 """Scanner auto-registration."""
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from .base import BaseScanner
 
 _registry: dict[str, BaseScanner] = {}
 
+# Read-only live view — callers iterate this without paying a dict copy
+# per call. All writes go through register_scanner.
+_registry_view: Mapping[str, BaseScanner] = MappingProxyType(_registry)
+
 
 def register_scanner(scanner: BaseScanner) -> None:
     _registry[scanner.source_id] = scanner
@@ -14,9 +19,9 @@ def get_scanner(source_id: str) -> Optional[BaseScanner]:
     return _registry.get(source_id)
 
 
-def get_all_scanners() -> dict[str, BaseScanner]:
-    return dict(_registry)
+def get_all_scanners() -> Mapping[str, BaseScanner]:
+    return _registry_view
 
 
-def scanner_registry() -> dict[str, BaseScanner]:
-    return dict(_registry)
+def scanner_registry() -> Mapping[str, BaseScanner]:
+    return _registry_view
@@ -1,18 +1,35 @@
 """Time Machine backup scanner."""
 
+import asyncio
 import os
 import re
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import AsyncIterator, Callable, Optional
+from typing import AsyncIterator, Callable, Iterator, Optional
 
 from ..models.common import FileMetadata, RecoveredFile
 from ..models.scan import ScanConfig
 from ..models.system import SourceAvailability
 from ..utils.macos_commands import get_tm_destination, list_tm_backups
+from ..utils.timestamps import dt_from_ts
 from .base import BaseScanner
 from .registry import register_scanner
 
+# st_birthtime exists on every stat result or none (macOS yes, Linux no)
+_HAS_BIRTHTIME = hasattr(os.stat_result, "st_birthtime")
+
+# Backups walked at once — the walks release the GIL on every syscall,
+# so a few threads keep the backup disk's queue full.
+_BACKUP_WORKERS = 4
+
+# Sentinel marking the end of the walk result stream
+_DONE = object()
+
+# Backup dirs are named like .../2025-12-15-123456
+_BACKUP_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})-(\d{6})")
+
 
 class TimeMachineScanner(BaseScanner):
     source_id = "time_machine"
@@ -56,12 +73,44 @@ class TimeMachineScanner(BaseScanner):
 
         live_volume = config.volume or "/"
 
-        for backup_path in backups:
+        # Live-volume directory listings, shared across backups — they
+        # all compare against the same live tree, so each directory is
+        # listed at most once for the whole scan. Shared between walker
+        # threads too; dict get/set are atomic, so a race costs at most
+        # a duplicate listdir.
+        live_names_cache: dict[str, frozenset] = {}
+
+        # Backups are independent trees, so walk several at once on a
+        # thread pool and stream results through a queue — the same
+        # producer/consumer bridge the APFS snapshot walker uses.
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def walk_backup(backup_path: str) -> None:
             if progress_callback:
-                progress_callback(f"Scanning backup {Path(backup_path).name}")
+                loop.call_soon_threadsafe(
+                    progress_callback, f"Scanning backup {Path(backup_path).name}"
+                )
+            for rf in self._scan_backup(backup_path, live_volume, live_names_cache):
+                loop.call_soon_threadsafe(queue.put_nowait, rf)
 
-            for rf in self._scan_backup(backup_path, live_volume):
-                yield rf
+        def producer() -> None:
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=min(_BACKUP_WORKERS, len(backups))
+                ) as pool:
+                    for fut in [pool.submit(walk_backup, b) for b in backups]:
+                        fut.result()
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+        threading.Thread(target=producer, name="tm-backup-walk", daemon=True).start()
+
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            yield item
 
     async def read_file_bytes(self, file: RecoveredFile) -> Optional[bytes]:
         try:
@@ -84,7 +133,7 @@ class TimeMachineScanner(BaseScanner):
 
     def _parse_backup_date(self, backup_path: str) -> Optional[datetime]:
         """Extract date from backup path like .../2025-12-15-123456"""
-        match = re.search(r"(\d{4}-\d{2}-\d{2})-(\d{6})", backup_path)
+        match = _BACKUP_DATE_RE.search(backup_path)
         if match:
             try:
                 return datetime.strptime(
@@ -95,79 +144,108 @@ class TimeMachineScanner(BaseScanner):
                 pass
         return None
 
-    def _scan_backup(self, backup_path: str, live_volume: str) -> list[RecoveredFile]:
-        """Walk a TM backup and find files not present on live FS."""
-        files = []
-        bp = Path(backup_path)
-
+    def _scan_backup(
+        self,
+        backup_path: str,
+        live_volume: str,
+        live_names_cache: dict[str, frozenset],
+    ) -> Iterator[RecoveredFile]:
+        """Walk a TM backup and yield files not present on live FS.
+
+        Uses an explicit os.scandir stack instead of os.walk: DirEntry
+        type and stat data come cached from the directory read, cutting
+        a stat(2) per entry, and the path relative to the volume root is
+        extended incrementally rather than recomputed per file. TM
+        backups run to millions of files, so the per-entry constant
+        dominates this scanner.
+
+        Liveness checks use one cached os.listdir per live directory
+        (a vanished directory caches as an empty set) instead of an
+        exists() syscall per backup file — the same scheme as the APFS
+        snapshot walker.
+        """
         # TM backups contain a volume directory structure
         # e.g., /Volumes/TMBackup/Backups.backupdb/Mac/2025-12-15-123456/Macintosh HD - Data/
         # Find the volume root inside the backup
-        volume_roots = []
-        if bp.exists() and bp.is_dir():
-            for child in bp.iterdir():
-                if child.is_dir() and not child.name.startswith("."):
-                    volume_roots.append(child)
+        volume_roots: list[str] = []
+        try:
+            with os.scandir(backup_path) as it:
+                for child in it:
+                    try:
+                        if child.is_dir(follow_symlinks=False) and not child.name.startswith("."):
+                            volume_roots.append(child.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
 
         if not volume_roots:
             # The backup itself might be the root
-            volume_roots = [bp]
+            volume_roots = [backup_path.rstrip("/")]
+
+        live_prefix = live_volume.rstrip("/") + "/"
+
+        def live_names(rel_dir: str) -> frozenset:
+            names = live_names_cache.get(rel_dir)
+            if names is None:
+                try:
+                    names = frozenset(os.listdir(live_prefix + rel_dir))
+                except OSError:
+                    names = frozenset()
+                live_names_cache[rel_dir] = names
+            return names
 
         for vol_root in volume_roots:
-            scan_dirs = ["Users", "Applications", "Library"]
-            for scan_dir in scan_dirs:
-                target = vol_root / scan_dir
-                if not target.exists():
+            for scan_dir in ("Users", "Applications", "Library"):
+                top = vol_root + "/" + scan_dir
+                if not os.path.isdir(top):
                     continue
 
-                for root, _dirs, filenames in os.walk(target):
-                    for fname in filenames:
-                        if fname.startswith("."):
-                            continue
-                        backup_file = Path(root) / fname
-                        relative = backup_file.relative_to(vol_root)
-                        live_path = Path(live_volume) / relative
-
-                        if not live_path.exists():
-                            rf = self._make_recovered_file(backup_file, str(live_path))
-                            if rf:
-                                files.append(rf)
-        return files
+                # (backup dir, its path relative to vol_root + "/")
+                stack: list[tuple[str, str]] = [(top, scan_dir + "/")]
+                while stack:
+                    d, rel_prefix = stack.pop()
+                    try:
+                        entries = os.scandir(d)
+                    except OSError:
+                        continue
+                    with entries:
+                        for entry in entries:
+                            name = entry.name
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    stack.append((entry.path, rel_prefix + name + "/"))
+                                    continue
+                                if name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                                    continue
+                                stat = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+
+                            if name not in live_names(rel_prefix):
+                                yield self._make_recovered_file(
+                                    entry.path, stat, live_prefix + rel_prefix + name
+                                )
 
     def _make_recovered_file(
         self,
-        path: Path,
+        path: str,
+        stat: os.stat_result,
         original_path: str,
-    ) -> Optional[RecoveredFile]:
-        try:
-            stat = path.stat()
-        except (OSError, PermissionError):
-            return None
-
-        created = None
-        modified = None
-        try:
-            created = datetime.fromtimestamp(stat.st_birthtime, tz=timezone.utc)
-        except AttributeError:
-            pass
-        try:
-            modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-        except (OSError, ValueError):
-            pass
-
-        ext = path.suffix.lower() if path.suffix else ""
-
-        return RecoveredFile(
+    ) -> RecoveredFile:
+        name = path[path.rfind("/") + 1:]
+        dot = name.rfind(".")
+        return RecoveredFile.build(
             source_id=self.source_id,
             original_path=original_path,
-            filename=path.name,
-            extension=ext,
-            metadata=FileMetadata(
+            filename=name,
+            extension=name[dot:].lower() if dot > 0 else "",
+            metadata=FileMetadata.build(
                 size=stat.st_size,
-                created=created,
-                modified=modified,
+                created=dt_from_ts(stat.st_birthtime) if _HAS_BIRTHTIME else None,
+                modified=dt_from_ts(stat.st_mtime),
             ),
-            access_path=str(path),
+            access_path=path,
         )
 
 
@@ -1,8 +1,11 @@
 """macOS Trash scanner."""
 
+import asyncio
+import ctypes
+import ctypes.util
 import os
 import struct
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import AsyncIterator, Callable, Optional
 
@@ -12,6 +15,28 @@ from ..models.system import SourceAvailability
 from .base import BaseScanner
 from .registry import register_scanner
 
+# NSDate epoch
+_MAC_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
+
+# os.getxattr only exists on Linux; macOS goes through libc
+_HAS_OS_GETXATTR = hasattr(os, "getxattr")
+
+# libc handle and getxattr prototype (macOS signature, with the
+# position/options tail), resolved once at import — the old fallback
+# paid a dlopen plus symbol resolution per trashed file.
+_getxattr_fn = None
+if not _HAS_OS_GETXATTR:
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        _getxattr_fn = _libc.getxattr
+        _getxattr_fn.argtypes = [
+            ctypes.c_char_p, ctypes.c_char_p, ctypes.c_void_p,
+            ctypes.c_size_t, ctypes.c_uint32, ctypes.c_int,
+        ]
+        _getxattr_fn.restype = ctypes.c_ssize_t
+    except Exception:
+        _getxattr_fn = None
+
 
 class TrashScanner(BaseScanner):
     source_id = "trash"
@@ -31,7 +56,9 @@ class TrashScanner(BaseScanner):
 
         if exists:
             try:
-                count = sum(1 for _ in user_trash.iterdir())
+                # scandir avoids a Path object per entry just to count
+                with os.scandir(user_trash) as it:
+                    count = sum(1 for _ in it)
                 detail = f"{count} items in user Trash"
             except PermissionError:
                 fda_issue = True
@@ -54,7 +81,6 @@ class TrashScanner(BaseScanner):
 
     async def _count_via_osascript(self) -> tuple[int, str]:
         """Use AppleScript to count Trash items when FDA is missing."""
-        import asyncio
         try:
             proc = await asyncio.create_subprocess_exec(
                 "osascript", "-e",
@@ -85,7 +111,10 @@ class TrashScanner(BaseScanner):
                 progress_callback(f"Scanning {trash_dir}")
 
             try:
-                items = self._walk_trash(trash_dir)
+                # The walk (plus two xattr reads per file) can take
+                # seconds on a packed trash; run it off the event loop
+                # so progress updates and other scanners keep moving.
+                items = await asyncio.to_thread(self._walk_trash, trash_dir)
                 for item in items:
                     found_any = True
                     yield item
@@ -124,40 +153,69 @@ class TrashScanner(BaseScanner):
     def _walk_trash(self, trash_dir: Path) -> list[RecoveredFile]:
         files = []
         try:
-            entries = list(trash_dir.iterdir())
-        except PermissionError:
+            entries = list(os.scandir(trash_dir))
+        except (PermissionError, OSError):
             return files
 
         for entry in entries:
             if entry.name.startswith("."):
                 continue
 
-            if entry.is_file():
-                rf = self._make_recovered_file(entry)
-                if rf:
-                    files.append(rf)
-            elif entry.is_dir():
-                # Recurse into directories in trash
-                for root, _dirs, filenames in os.walk(entry):
-                    for fname in filenames:
-                        if fname.startswith("."):
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    rf = self._make_recovered_file(
+                        entry.path, stat=entry.stat(follow_symlinks=False)
+                    )
+                    if rf:
+                        files.append(rf)
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+
+            # Recurse into directories in trash with a scandir stack —
+            # DirEntry carries cached type/stat, so no per-file re-stat
+            base = entry.path
+            stack = [entry.path]
+            while stack:
+                d = stack.pop()
+                try:
+                    sub_entries = os.scandir(d)
+                except OSError:
+                    continue
+                with sub_entries:
+                    for sub in sub_entries:
+                        try:
+                            if sub.is_dir(follow_symlinks=False):
+                                stack.append(sub.path)
+                            elif not sub.name.startswith(".") and sub.is_file(follow_symlinks=False):
+                                rf = self._make_recovered_file(
+                                    sub.path,
+                                    base_dir=base,
+                                    stat=sub.stat(follow_symlinks=False),
+                                )
+                                if rf:
+                                    files.append(rf)
+                        except OSError:
                             continue
-                        fpath = Path(root) / fname
-                        rf = self._make_recovered_file(fpath, base_dir=entry)
-                        if rf:
-                            files.append(rf)
         return files
 
     def _make_recovered_file(
-        self, path: Path, base_dir: Optional[Path] = None,
+        self,
+        path: str,
+        base_dir: Optional[str] = None,
+        stat: Optional[os.stat_result] = None,
     ) -> Optional[RecoveredFile]:
-        try:
-            stat = path.stat()
-        except (OSError, PermissionError):
-            return None
+        # Walkers that already hold a stat (scandir DirEntry) pass it in
+        # so the file isn't stat'ed a second time
+        if stat is None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
 
-        original_path = self._get_original_path(path)
-        deleted_date = self._get_deletion_date(path)
+        original_path, deleted_date = self._read_trash_xattrs(path)
 
         created = None
         modified = None
@@ -170,69 +228,51 @@ class TrashScanner(BaseScanner):
         except (OSError, ValueError):
             pass
 
-        ext = path.suffix.lower() if path.suffix else ""
+        name = os.path.basename(path)
 
         return RecoveredFile(
             source_id=self.source_id,
-            original_path=original_path or str(path),
-            filename=path.name,
-            extension=ext,
+            original_path=original_path or path,
+            filename=name,
+            extension=os.path.splitext(name)[1].lower(),
             metadata=FileMetadata(
                 size=stat.st_size,
                 created=created,
                 modified=modified,
                 deleted_date=deleted_date,
             ),
-            access_path=str(path),
+            access_path=path,
         )
 
-    def _get_original_path(self, path: Path) -> Optional[str]:
-        """Try reading com.apple.trash.origpath xattr via pure Python."""
-        try:
-            import xattr as xattr_mod
-            val = xattr_mod.getxattr(str(path), "com.apple.trash.origpath")
-            return val.decode("utf-8", errors="replace").rstrip("\x00")
-        except Exception:
-            pass
-        # Fallback: try os module
-        try:
-            val = os.getxattr(str(path), "com.apple.trash.origpath")  # type: ignore[attr-defined]
-            return val.decode("utf-8", errors="replace").rstrip("\x00")
-        except (AttributeError, OSError):
-            pass
-        # Last resort: use ctypes to call getxattr
-        try:
-            return self._getxattr_ctypes(str(path), "com.apple.trash.origpath")
-        except Exception:
-            pass
-        return None
-
-    def _get_deletion_date(self, path: Path) -> Optional[datetime]:
-        """Try reading com.apple.trash.deletiondate xattr."""
-        raw = None
-        try:
-            import xattr as xattr_mod
-            raw = xattr_mod.getxattr(str(path), "com.apple.trash.deletiondate")
-        except Exception:
-            pass
-        if raw is None:
-            try:
-                raw = os.getxattr(str(path), "com.apple.trash.deletiondate")  # type: ignore[attr-defined]
-            except (AttributeError, OSError):
-                pass
-        if raw is None:
-            try:
-                raw = self._getxattr_ctypes_raw(str(path), "com.apple.trash.deletiondate")
-            except Exception:
-                pass
-        if raw:
-            return self._parse_deletion_date(raw)
-        return None
+    def _read_trash_xattrs(self, path: str) -> tuple[Optional[str], Optional[datetime]]:
+        """Read Finder's origpath and deletiondate xattrs in one pass.
+
+        On the libc path the two reads share one scratch buffer instead
+        of allocating 4KB per attribute per file.
+        """
+        buf = None if _HAS_OS_GETXATTR else ctypes.create_string_buffer(4096)
+        raw_orig = self._getxattr(path, "com.apple.trash.origpath", buf)
+        raw_date = self._getxattr(path, "com.apple.trash.deletiondate", buf)
+        original = (
+            raw_orig.decode("utf-8", errors="replace").rstrip("\x00")
+            if raw_orig else None
+        )
+        deleted = self._parse_deletion_date(raw_date) if raw_date else None
+        return original, deleted
 
     def _parse_deletion_date(self, raw: bytes) -> Optional[datetime]:
         """Parse the binary plist deletion date from trash xattr."""
-        # The deletion date is stored as a binary plist containing an NSDate
-        # NSDate epoch is 2001-01-01
+        # The xattr is a tiny fixed-shape binary plist holding a single
+        # NSDate: 'bplist00' magic, then an 0x33-tagged big-endian
+        # double of seconds since the Mac epoch. Slicing it directly
+        # skips spinning up plistlib's pure-Python parser per file.
+        if len(raw) >= 17 and raw[:8] == b"bplist00" and raw[8] == 0x33:
+            try:
+                secs = struct.unpack_from(">d", raw, 9)[0]
+                return _MAC_EPOCH + timedelta(seconds=secs)
+            except struct.error:
+                pass
+        # Fallback for any other plist shape
         try:
             import plistlib
             val = plistlib.loads(raw)
@@ -240,46 +280,40 @@ class TrashScanner(BaseScanner):
                 return val
         except Exception:
             pass
-        # Try as a Core Data timestamp (seconds since 2001-01-01)
+        # Try as a bare Core Data timestamp (seconds since 2001-01-01)
         if len(raw) == 8:
             try:
                 ts = struct.unpack(">d", raw)[0]
-                mac_epoch = datetime(2001, 1, 1, tzinfo=timezone.utc)
-                from datetime import timedelta
-                return mac_epoch + timedelta(seconds=ts)
+                return _MAC_EPOCH + timedelta(seconds=ts)
             except Exception:
                 pass
         return None
 
-    def _getxattr_ctypes(self, path: str, attr: str) -> Optional[str]:
-        """Read xattr using ctypes."""
-        import ctypes
-        import ctypes.util
-        libc = ctypes.CDLL(ctypes.util.find_library("c"))
-        buf = ctypes.create_string_buffer(4096)
-        path_b = path.encode("utf-8")
-        attr_b = attr.encode("utf-8")
-        size = libc.getxattr(path_b, attr_b, buf, 4096, 0, 0)
-        if size > 0:
-            return buf.raw[:size].decode("utf-8", errors="replace").rstrip("\x00")
-        return None
+    @staticmethod
+    def _getxattr(path: str, attr: str, buf=None) -> Optional[bytes]:
+        """Read an xattr's raw bytes.
 
-    def _getxattr_ctypes_raw(self, path: str, attr: str) -> Optional[bytes]:
-        """Read xattr raw bytes using ctypes."""
-        import ctypes
-        import ctypes.util
-        libc = ctypes.CDLL(ctypes.util.find_library("c"))
-        buf = ctypes.create_string_buffer(4096)
-        path_b = path.encode("utf-8")
-        attr_b = attr.encode("utf-8")
-        size = libc.getxattr(path_b, attr_b, buf, 4096, 0, 0)
+        os.getxattr where the platform has it (Linux); otherwise the
+        module-level libc binding (macOS). Callers reading several
+        attrs off one file may pass a shared scratch buffer; the raw
+        bytes are copied out before return, so reuse is safe.
+        """
+        if _HAS_OS_GETXATTR:
+            try:
+                return os.getxattr(path, attr)  # type: ignore[attr-defined]
+            except OSError:
+                return None
+        if _getxattr_fn is None:
+            return None
+        if buf is None:
+            buf = ctypes.create_string_buffer(4096)
+        size = _getxattr_fn(path.encode("utf-8"), attr.encode("utf-8"), buf, 4096, 0, 0)
         if size > 0:
             return buf.raw[:size]
         return None
 
     async def _scan_via_osascript(self) -> list[RecoveredFile]:
         """Fallback: list Trash items via AppleScript when FDA is unavailable."""
-        import asyncio
         files = []
         try:
             # Get trash item paths via Finder
@@ -1,11 +1,40 @@
 """Centralized date filtering logic."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
 from ..models.common import DateRange, FileMetadata, RecoveredFile
 
 
+def make_date_range_predicate(
+    date_range: Optional[DateRange],
+) -> Callable[[RecoveredFile], bool]:
+    """Build a per-file predicate with the range bounds normalised once.
+
+    Bulk callers (the scan pipeline filters every yielded file) grab
+    one predicate per scan instead of re-normalising the constant
+    bounds on each of potentially millions of calls.
+    """
+    if date_range is None:
+        return lambda file: True
+
+    start = _normalize(date_range.start)
+    end = _normalize(date_range.end)
+
+    def predicate(file: RecoveredFile) -> bool:
+        best_date = file.metadata.best_date
+        if best_date is None:
+            return True  # no date info, include conservatively
+        # Inlined _normalize: scanner dates are aware UTC, but a few
+        # fallback parsers produce naive values, so the tzinfo check
+        # has to stay for mixed-awareness comparisons
+        if best_date.tzinfo is not None:
+            best_date = best_date.replace(tzinfo=None)
+        return start <= best_date <= end
+
+    return predicate
+
+
 def file_matches_date_range(file: RecoveredFile, date_range: Optional[DateRange]) -> bool:
     """Check if a file's dates fall within the target range.
 
@@ -28,10 +57,7 @@ def file_matches_date_range(file: RecoveredFile, date_range: Optional[DateRange]
 
 def get_best_date(metadata: FileMetadata) -> Optional[datetime]:
     """Get the most relevant date from file metadata (waterfall)."""
-    for dt in [metadata.deleted_date, metadata.modified, metadata.created, metadata.accessed]:
-        if dt is not None:
-            return dt
-    return None
+    return metadata.best_date
 
 
 def _normalize(dt: datetime) -> datetime:
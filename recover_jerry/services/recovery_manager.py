@@ -1,6 +1,8 @@
 """Recovery job lifecycle."""
 
 import asyncio
+import logging
+import time
 from datetime import datetime, timezone
 from typing import Optional, Callable
 
@@ -13,6 +15,16 @@ from ..models.recovery import (
 from ..recovery.engine import RecoveryEngine
 from .scan_manager import scan_manager
 
+logger = logging.getLogger(__name__)
+
+
+async def _notify_one(cb: Callable, job) -> None:
+    """Await one progress listener, swallowing its failures."""
+    try:
+        await cb(job)
+    except Exception:
+        pass
+
 
 class RecoveryManager:
     def __init__(self):
@@ -29,7 +41,11 @@ class RecoveryManager:
         return self._jobs.get(job_id)
 
     def add_progress_listener(self, job_id: str, callback: Callable) -> None:
-        self._progress_listeners.setdefault(job_id, []).append(callback)
+        # Dedupe, matching ScanManager: repeated registrations of the
+        # shared ws callback would re-serialise every notification
+        listeners = self._progress_listeners.setdefault(job_id, [])
+        if callback not in listeners:
+            listeners.append(callback)
 
     def remove_progress_listener(self, job_id: str, callback: Callable) -> None:
         listeners = self._progress_listeners.get(job_id, [])
@@ -40,23 +56,46 @@ class RecoveryManager:
         job = self._jobs.get(job_id)
         if not job:
             return
-        task = asyncio.create_task(self._run_recovery(job))
+        self._spawn(job_id, self._run_recovery(job))
+
+    def _spawn(self, job_id: str, coro) -> None:
+        """Track a job task and drop it (logging failures) when done.
+
+        Same structured tracking as ScanManager._spawn — without the
+        done callback the task map (and each task's retained result)
+        grew for the server's whole lifetime.
+        """
+        task = asyncio.create_task(coro)
+        task.add_done_callback(lambda t: self._on_task_done(job_id, t))
         self._tasks[job_id] = task
 
+    def _on_task_done(self, job_id: str, task: asyncio.Task) -> None:
+        self._tasks.pop(job_id, None)
+        # Nothing notifies after the task ends, so listeners that were
+        # never explicitly removed would otherwise accumulate per job
+        self._progress_listeners.pop(job_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Recovery task for job {job_id} failed: {task.exception()!r}")
+
     async def _run_recovery(self, job: RecoveryJob) -> None:
         job.status = RecoveryStatus.RUNNING
         await self._notify_progress(job)
 
-        # Gather the actual files from scan results
-        scan_files = scan_manager.get_results(job.request.job_id)
-        file_map = {f.id: f for f in scan_files}
-        files_to_recover = [
-            file_map[fid] for fid in job.request.file_ids if fid in file_map
-        ]
+        # Gather the actual files from scan results — O(K) id lookups
+        # against the scan manager's per-job index, accumulating the
+        # byte total in the same pass instead of re-traversing
+        files_to_recover = []
+        bytes_total = 0
+        for fid in job.request.file_ids:
+            f = scan_manager.get_file(job.request.job_id, fid)
+            if f is None:
+                continue
+            files_to_recover.append(f)
+            bytes_total += f.metadata.size
 
         job.progress = RecoveryProgress(
             files_total=len(files_to_recover),
-            bytes_total=sum(f.metadata.size for f in files_to_recover),
+            bytes_total=bytes_total,
         )
         await self._notify_progress(job)
 
@@ -66,6 +105,15 @@ class RecoveryManager:
             verify_checksums=job.request.verify_checksums,
         )
 
+        # Notify at most every 250ms and only once enough files have
+        # finished to matter (~1% of the job) — a per-result websocket
+        # fan-out on a 10k-file job is 10k awaits competing with the
+        # recovery I/O itself. Mirrors the throttle in
+        # ScanManager._run_scan.
+        total = job.progress.files_total
+        notify_delta = max(1, total // 100)
+        next_notify_at = 0.0
+        last_notify_done = 0
         try:
             async for result in engine.recover_files(files_to_recover):
                 job.results.append(result)
@@ -73,13 +121,19 @@ class RecoveryManager:
                     job.progress.files_recovered += 1
                 else:
                     job.progress.files_failed += 1
+                done = job.progress.files_recovered + job.progress.files_failed
                 job.progress.current_file = result.original_path
-                job.progress.percent = (
-                    (job.progress.files_recovered + job.progress.files_failed)
-                    / job.progress.files_total * 100
-                ) if job.progress.files_total > 0 else 0
-                job.progress.message = f"Recovered {job.progress.files_recovered}/{job.progress.files_total}"
-                await self._notify_progress(job)
+                job.progress.percent = (done / total * 100) if total > 0 else 0
+                job.progress.message = f"Recovered {job.progress.files_recovered}/{total}"
+                # Integer delta check first: the clock is only read once
+                # enough files have finished, and the stored deadline
+                # replaces a subtraction per result
+                if done - last_notify_done >= notify_delta:
+                    now = time.monotonic()
+                    if now >= next_notify_at:
+                        next_notify_at = now + 0.25
+                        last_notify_done = done
+                        await self._notify_progress(job)
 
             job.status = RecoveryStatus.COMPLETED
             job.completed_at = datetime.now(tz=timezone.utc)
@@ -99,12 +153,14 @@ class RecoveryManager:
             await self._notify_progress(job)
 
     async def _notify_progress(self, job: RecoveryJob) -> None:
+        # Fan out concurrently so one slow websocket send doesn't
+        # serialise the others or stall recovery
         listeners = self._progress_listeners.get(job.id, [])
-        for cb in listeners:
-            try:
-                await cb(job)
-            except Exception:
-                pass
+        if listeners:
+            await asyncio.gather(
+                *(_notify_one(cb, job) for cb in listeners),
+                return_exceptions=True,
+            )
 
 
 # Singleton
@@ -0,0 +1,149 @@
+"""SQLite-backed index for filtering/sorting large scan result sets."""
+
+import sqlite3
+from datetime import datetime
+from typing import Optional, Sequence
+
+from ..models.common import RecoveredFile
+
+# Maps the API's sort_by values to indexed columns.
+_SORT_COLUMNS = {
+    "filename": "filename_lower",
+    "size": "size",
+    "modified": "modified_ts",
+    "created": "created_ts",
+    "extension": "extension",
+    "source": "source_id",
+}
+
+
+def _ts(dt: Optional[datetime]) -> Optional[float]:
+    return dt.timestamp() if dt is not None else None
+
+
+class ResultStore:
+    """Immutable SQLite index over one job's result list.
+
+    Built once when a result set settles. Queries then run as a single
+    indexed SELECT inside SQLite's C engine instead of an interpreted
+    Python loop per request. Rows hold only the columns needed to filter
+    and sort plus the file's position in the backing list, so only the
+    returned page is materialised back into RecoveredFile objects.
+
+    Search uses instr() on a precomputed lowercase filename+path blob to
+    keep the API's substring semantics (FTS5 MATCH is token-based and
+    would not match partial words).
+    """
+
+    def __init__(self, files: Sequence[RecoveredFile]):
+        self._files = files
+        self._stats: Optional[dict] = None
+        self._db = sqlite3.connect(":memory:")
+        self._db.execute(
+            "CREATE TABLE results ("
+            " pos INTEGER PRIMARY KEY,"
+            " filename_lower TEXT,"
+            " extension TEXT,"
+            " source_id TEXT,"
+            " size INTEGER,"
+            " modified_ts REAL,"
+            " created_ts REAL,"
+            " search_blob TEXT)"
+        )
+        rows = []
+        for pos, f in enumerate(files):
+            md = f.metadata
+            rows.append((
+                pos,
+                f.filename.lower(),
+                f.extension_lower,
+                f.source_id,
+                md.size,
+                # Same waterfall the old sort key used: modified, then created
+                _ts(md.modified) if md.modified else _ts(md.created),
+                _ts(md.created),
+                f.search_blob,
+            ))
+        self._db.executemany(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        self._db.execute("CREATE INDEX idx_results_ext ON results(extension)")
+        self._db.execute("CREATE INDEX idx_results_source ON results(source_id)")
+        self._db.execute("CREATE INDEX idx_results_filename ON results(filename_lower)")
+        self._db.execute("CREATE INDEX idx_results_size ON results(size)")
+        self._db.commit()
+
+    def query(
+        self,
+        *,
+        search: Optional[str] = None,
+        extension: Optional[str] = None,
+        source: Optional[str] = None,
+        sort_by: str = "filename",
+        sort_order: str = "asc",
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[int, list[RecoveredFile]]:
+        """Filter, sort and paginate. Returns (total matching, page)."""
+        where = []
+        params: list = []
+        if search:
+            where.append("instr(search_blob, ?) > 0")
+            params.append(search.lower())
+        if extension:
+            ext = extension if extension.startswith(".") else f".{extension}"
+            where.append("extension = ?")
+            params.append(ext.lower())
+        if source:
+            where.append("source_id = ?")
+            params.append(source)
+
+        where_sql = f" WHERE {' AND '.join(where)}" if where else ""
+        column = _SORT_COLUMNS.get(sort_by, "filename_lower")
+        direction = "DESC" if sort_order == "desc" else "ASC"
+
+        # COUNT(*) OVER () piggybacks the total on the page query, so a
+        # substring search scans the corpus once instead of twice. An
+        # empty page (offset past the end) still needs the COUNT query.
+        rows = self._db.execute(
+            f"SELECT pos, COUNT(*) OVER () FROM results{where_sql}"
+            f" ORDER BY {column} {direction}, pos LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+        if rows:
+            total = rows[0][1]
+        else:
+            total = self._db.execute(
+                f"SELECT COUNT(*) FROM results{where_sql}", params
+            ).fetchone()[0]
+        return total, [self._files[row[0]] for row in rows]
+
+    def stats(self) -> dict:
+        """Aggregate counts/sizes in SQLite instead of a Python loop.
+
+        Memoised: the store is immutable, so the dict is computed once
+        per settled result set.
+        """
+        if self._stats is None:
+            total_files, total_size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+            by_source = dict(self._db.execute(
+                "SELECT source_id, COUNT(*) FROM results GROUP BY source_id"
+            ))
+            by_extension = {
+                (ext or "(no ext)"): count
+                for ext, count in self._db.execute(
+                    "SELECT extension, COUNT(*) FROM results GROUP BY extension"
+                )
+            }
+            self._stats = {
+                "total_files": total_files,
+                "total_size": total_size,
+                "by_source": by_source,
+                "by_extension": by_extension,
+            }
+        return self._stats
+
+    def close(self) -> None:
+        self._db.close()
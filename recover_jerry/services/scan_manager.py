@@ -1,25 +1,119 @@
 """Scan job lifecycle and async orchestration."""
 
 import asyncio
+import functools
 import logging
-import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional, Callable
+from typing import Optional, Callable, Sequence
 
 from ..models.scan import ScanConfig, ScanJob, ScanStatus, ScanProgress, ScanResult
 from ..models.common import RecoveredFile
 from ..scanners.registry import get_scanner
-from ..services.date_filter import file_matches_date_range
+from ..services.date_filter import make_date_range_predicate
+from ..services.result_store import ResultStore
 
 logger = logging.getLogger(__name__)
 
+# Max distinct (job, query) pages kept for repeat requests
+_PAGE_CACHE_SIZE = 64
+
+# Extension sets backing the file_types filter
+FILE_TYPE_EXT_MAP: dict[str, frozenset[str]] = {
+    "image": frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".tiff", ".bmp", ".svg"}),
+    "document": frozenset({".pdf", ".doc", ".docx", ".txt", ".rtf", ".pages", ".odt", ".xls", ".xlsx", ".csv"}),
+    "video": frozenset({".mp4", ".mov", ".avi", ".mkv", ".wmv", ".m4v"}),
+    "audio": frozenset({".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"}),
+    "code": frozenset({".py", ".js", ".ts", ".jsx", ".tsx", ".html", ".css", ".json", ".yaml", ".yml", ".md", ".sh", ".go", ".rs", ".java", ".c", ".cpp", ".h", ".swift"}),
+}
+
+
+def _build_filter_index(config: ScanConfig) -> Optional[frozenset[str]]:
+    """Collapse the config's type/extension filters into one set.
+
+    Returns the allowed lowercase extensions, or None when no filter is
+    configured. Doing this once per scan turns the per-file check into
+    a single frozenset membership test instead of nested tuple scans
+    and a list comprehension per yielded file.
+    """
+    exts = None
+    if config.file_extensions:
+        exts = config.normalized_extensions
+    if config.file_types:
+        type_exts: frozenset[str] = frozenset().union(
+            *(FILE_TYPE_EXT_MAP.get(ft.lower(), frozenset()) for ft in config.file_types)
+        )
+        # Both filters set means both must match, as before
+        exts = type_exts if exts is None else exts & type_exts
+    return exts
+
+
+async def _notify_one(cb: Callable, job) -> None:
+    """Await one progress listener, swallowing its failures."""
+    try:
+        await cb(job)
+    except Exception:
+        pass
+
+
+class _Debouncer:
+    """Trailing-edge coalescer for progress notifications.
+
+    touch() marks state dirty and arms a timer on first change; when
+    the timer fires, one notification carries the freshest snapshot no
+    matter how many touches landed in the window. Unlike the old
+    wall-clock throttle, a burst followed by silence still gets its
+    final state pushed, and idle periods send nothing at all.
+    """
+
+    def __init__(self, interval: float, fn: Callable):
+        self._interval = interval
+        self._fn = fn  # async callable taking no args
+        self._handle = None
+        self._dirty = False
+
+    def touch(self) -> None:
+        self._dirty = True
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(
+                self._interval, self._fire
+            )
+
+    def _fire(self) -> None:
+        self._handle = None
+        if self._dirty:
+            self._dirty = False
+            asyncio.get_running_loop().create_task(self._fn())
+
+    async def flush(self) -> None:
+        """Send immediately if anything changed since the last send."""
+        self.cancel_timer()
+        if self._dirty:
+            self._dirty = False
+            await self._fn()
+
+    def cancel_timer(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
 
 class ScanManager:
     def __init__(self):
         self._jobs: dict[str, ScanJob] = {}
-        self._results: dict[str, list[RecoveredFile]] = {}
+        # list while a scan is running; frozen to a tuple on completion
+        self._results: dict[str, Sequence[RecoveredFile]] = {}
         self._tasks: dict[str, asyncio.Task] = {}
+        # Scanners with a cleanup() hook, resolved once at scan start
+        # so cancellation doesn't re-dispatch through the registry
+        self._cleanups: dict[str, list] = {}
         self._progress_listeners: dict[str, list[Callable]] = {}
+        # Cached SQLite index per job: (version token, store)
+        self._store_cache: dict[str, tuple[tuple[int, int], ResultStore]] = {}
+        # Cached id -> file map per job: (version token, mapping)
+        self._by_id_cache: dict[str, tuple[tuple[int, int], dict[str, RecoveredFile]]] = {}
+        # Bounded LRU of query pages, keyed by full query + version token
+        self._page_cache: OrderedDict[tuple, tuple[int, list[RecoveredFile]]] = OrderedDict()
 
     def create_job(self, config: ScanConfig) -> ScanJob:
         job = ScanJob(config=config)
@@ -30,11 +124,92 @@ class ScanManager:
     def get_job(self, job_id: str) -> Optional[ScanJob]:
         return self._jobs.get(job_id)
 
-    def get_results(self, job_id: str) -> list[RecoveredFile]:
+    def get_results(self, job_id: str) -> Sequence[RecoveredFile]:
         return self._results.get(job_id, [])
 
+    def _version_token(self, job_id: str) -> tuple[int, int]:
+        """Cheap change token: catches both appends and wholesale
+        replacement of the result sequence."""
+        files = self._results.get(job_id, ())
+        return (id(files), len(files))
+
+    def get_file(self, job_id: str, file_id: str) -> Optional[RecoveredFile]:
+        """O(1) lookup of a single result by id.
+
+        Previews and recovery start-up resolve files by id; a linear
+        scan over the result list is O(N) per lookup on scans with
+        millions of files.
+        """
+        files = self._results.get(job_id, [])
+        token = self._version_token(job_id)
+        cached = self._by_id_cache.get(job_id)
+        if cached is None or cached[0] != token:
+            cached = (token, {f.id: f for f in files})
+            self._by_id_cache[job_id] = cached
+        return cached[1].get(file_id)
+
+    def query_results(
+        self,
+        job_id: str,
+        *,
+        search: Optional[str] = None,
+        extension: Optional[str] = None,
+        source: Optional[str] = None,
+        sort_by: str = "filename",
+        sort_order: str = "asc",
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[int, list[RecoveredFile]]:
+        """Filter, sort and paginate a job's results.
+
+        Queries run against a per-job SQLite index (see ResultStore),
+        rebuilt only when the result list changes, so a paginating or
+        polling UI pays one indexed SELECT instead of a full Python
+        filter + sort per request. Identical queries against an
+        unchanged result set (a polling UI) come straight from a small
+        LRU of recent pages. Returns (total matching, page).
+        """
+        key = (
+            job_id, self._version_token(job_id),
+            search, extension, source, sort_by, sort_order, offset, limit,
+        )
+        page = self._page_cache.get(key)
+        if page is not None:
+            self._page_cache.move_to_end(key)
+            return page
+
+        page = self._get_store(job_id).query(
+            search=search,
+            extension=extension,
+            source=source,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            offset=offset,
+            limit=limit,
+        )
+        self._page_cache[key] = page
+        if len(self._page_cache) > _PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return page
+
+    def _get_store(self, job_id: str) -> ResultStore:
+        files = self._results.get(job_id, [])
+        token = self._version_token(job_id)
+        cached = self._store_cache.get(job_id)
+        if cached is None or cached[0] != token:
+            if cached is not None:
+                cached[1].close()
+            cached = (token, ResultStore(files))
+            self._store_cache[job_id] = cached
+        return cached[1]
+
     def add_progress_listener(self, job_id: str, callback: Callable) -> None:
-        self._progress_listeners.setdefault(job_id, []).append(callback)
+        # Dedupe: the ws layer registers one shared callback per job,
+        # and a second registration would serialise every notification
+        # twice for nothing
+        listeners = self._progress_listeners.setdefault(job_id, [])
+        if callback not in listeners:
+            listeners.append(callback)
 
     def remove_progress_listener(self, job_id: str, callback: Callable) -> None:
         listeners = self._progress_listeners.get(job_id, [])
@@ -45,25 +220,43 @@ class ScanManager:
         job = self._jobs.get(job_id)
         if not job:
             return
+        self._spawn(job_id, self._run_scan(job))
+
+    def _spawn(self, job_id: str, coro) -> None:
+        """Track a job task and drop it (logging failures) when done.
 
-        task = asyncio.create_task(self._run_scan(job))
+        Completed tasks retain their result/exception until collected;
+        without the done callback the task map grew for the server's
+        whole lifetime.
+        """
+        task = asyncio.create_task(coro)
+        task.add_done_callback(lambda t: self._on_task_done(job_id, t))
         self._tasks[job_id] = task
 
+    def _on_task_done(self, job_id: str, task: asyncio.Task) -> None:
+        self._tasks.pop(job_id, None)
+        self._cleanups.pop(job_id, None)
+        # Nothing notifies after the task ends, so listeners that were
+        # never explicitly removed would otherwise accumulate per job
+        self._progress_listeners.pop(job_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Scan task for job {job_id} failed: {task.exception()!r}")
+
     async def cancel_scan(self, job_id: str) -> bool:
         task = self._tasks.get(job_id)
         job = self._jobs.get(job_id)
         if task and job:
+            # Snapshot before awaiting: the task's done callback drops
+            # the cleanup list once the cancellation lands
+            cleanups = list(self._cleanups.get(job_id, ()))
             task.cancel()
             job.status = ScanStatus.CANCELLED
             await self._notify_progress(job)
-            # Clean up any running scanner processes
-            for source_id in job.config.sources:
-                scanner = get_scanner(source_id)
-                if scanner and hasattr(scanner, 'cleanup'):
-                    try:
-                        await scanner.cleanup()
-                    except Exception:
-                        pass
+            # Clean up any running scanner processes, concurrently
+            if cleanups:
+                await asyncio.gather(
+                    *(s.cleanup() for s in cleanups), return_exceptions=True
+                )
             return True
         return False
 
@@ -74,23 +267,42 @@ class ScanManager:
         )
         await self._notify_progress(job)
 
+        # One predicate per scan: the date bounds are normalised once
+        # rather than per yielded file
+        matches_date = make_date_range_predicate(job.config.date_range)
+        allowed_exts = _build_filter_index(job.config)
+
+        self._cleanups[job.id] = [
+            s for s in (get_scanner(sid) for sid in job.config.sources)
+            if s is not None and hasattr(s, "cleanup")
+        ]
+
+        # Hot-loop locals: the per-file body otherwise pays two dict
+        # lookups plus a len() call for every kept file
+        results = self._results[job.id]
+        progress = job.progress
+
+        # Coalesce mid-scan notifications: many results in a 5s window
+        # become one push, and the freshest state always goes out after
+        # a burst instead of waiting for the next file
+        debouncer = _Debouncer(5.0, functools.partial(self._notify_progress, job))
+
         try:
             for i, source_id in enumerate(job.config.sources):
                 scanner = get_scanner(source_id)
                 if not scanner:
                     continue
 
-                job.progress.current_source = scanner.name
-                job.progress.sources_completed = i + 1
-                job.progress.percent = ((i + 1) / len(job.config.sources)) * 100
-                job.progress.message = f"Scanning {scanner.name}..."
+                progress.current_source = scanner.name
+                progress.sources_completed = i + 1
+                progress.percent = ((i + 1) / len(job.config.sources)) * 100
+                progress.message = f"Scanning {scanner.name}..."
                 await self._notify_progress(job)
 
-                last_notify_time = 0
-
                 def progress_cb(msg: str):
                     job.progress.message = msg
                     logger.info(f"[{scanner.name}] {msg}")
+                    debouncer.touch()
 
                 file_count = 0
                 filtered_date = 0
@@ -101,33 +313,32 @@ class ScanManager:
                 async for file in scanner.scan(job.config, progress_cb):
                     file_count += 1
                     # Apply date filter (skip for file carving)
-                    if skip_date_filter or file_matches_date_range(file, job.config.date_range):
+                    if skip_date_filter or matches_date(file):
                         # Apply file type/extension filters
-                        if self._matches_filters(file, job.config):
-                            self._results[job.id].append(file)
-                            job.progress.files_found = len(self._results[job.id])
-                            # Throttle WS notifications: max once per 5 seconds
-                            now = time.monotonic()
-                            if now - last_notify_time >= 5.0:
-                                last_notify_time = now
-                                await self._notify_progress(job)
+                        if allowed_exts is None or file.extension_lower in allowed_exts:
+                            results.append(file)
+                            progress.files_found += 1
+                            debouncer.touch()
                         else:
                             filtered_type += 1
                     else:
                         filtered_date += 1
-                # Always notify at end of each source
-                await self._notify_progress(job)
+                # Push whatever changed during this source
+                await debouncer.flush()
                 logger.info(
                     f"[{scanner.name}] Done: {file_count} yielded, "
                     f"{filtered_date} filtered by date, {filtered_type} filtered by type, "
-                    f"{job.progress.files_found} kept"
+                    f"{progress.files_found} kept"
                 )
 
             job.status = ScanStatus.COMPLETED
             job.completed_at = datetime.now(tz=timezone.utc)
-            job.progress.sources_completed = len(job.config.sources)
-            job.progress.percent = 100.0
-            job.progress.message = f"Scan complete. Found {job.progress.files_found} files."
+            # Freeze the settled result set; every cache layer keyed on
+            # the version token now stays valid for the job's lifetime.
+            self._results[job.id] = tuple(results)
+            progress.sources_completed = len(job.config.sources)
+            progress.percent = 100.0
+            progress.message = f"Scan complete. Found {progress.files_found} files."
             await self._notify_progress(job)
 
         except asyncio.CancelledError:
@@ -137,57 +348,23 @@ class ScanManager:
             job.status = ScanStatus.FAILED
             job.error = str(e)
             await self._notify_progress(job)
-
-    def _matches_filters(self, file: RecoveredFile, config: ScanConfig) -> bool:
-        """Check file type and extension filters."""
-        if config.file_extensions:
-            normalized = [ext if ext.startswith(".") else f".{ext}" for ext in config.file_extensions]
-            if file.extension.lower() not in normalized:
-                return False
-
-        if config.file_types:
-            mime = (file.metadata.mime_type or "").lower()
-            for ft in config.file_types:
-                ft = ft.lower()
-                if ft == "image" and file.extension in (".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".tiff", ".bmp", ".svg"):
-                    break
-                if ft == "document" and file.extension in (".pdf", ".doc", ".docx", ".txt", ".rtf", ".pages", ".odt", ".xls", ".xlsx", ".csv"):
-                    break
-                if ft == "video" and file.extension in (".mp4", ".mov", ".avi", ".mkv", ".wmv", ".m4v"):
-                    break
-                if ft == "audio" and file.extension in (".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"):
-                    break
-                if ft == "code" and file.extension in (".py", ".js", ".ts", ".jsx", ".tsx", ".html", ".css", ".json", ".yaml", ".yml", ".md", ".sh", ".go", ".rs", ".java", ".c", ".cpp", ".h", ".swift"):
-                    break
-            else:
-                return False
-
-        return True
+        finally:
+            # Terminal notifies above are unconditional; just disarm
+            # any pending timer so it can't fire after the scan ends
+            debouncer.cancel_timer()
 
     async def _notify_progress(self, job: ScanJob) -> None:
+        # Fan out concurrently so one slow websocket send doesn't
+        # serialise the others or stall the scan pipeline
         listeners = self._progress_listeners.get(job.id, [])
-        for cb in listeners:
-            try:
-                await cb(job)
-            except Exception:
-                pass
+        if listeners:
+            await asyncio.gather(
+                *(_notify_one(cb, job) for cb in listeners),
+                return_exceptions=True,
+            )
 
     def get_result_stats(self, job_id: str) -> dict:
-        files = self._results.get(job_id, [])
-        total_size = sum(f.metadata.size for f in files)
-        by_source = {}
-        by_extension = {}
-        for f in files:
-            by_source[f.source_id] = by_source.get(f.source_id, 0) + 1
-            ext = f.extension or "(no ext)"
-            by_extension[ext] = by_extension.get(ext, 0) + 1
-
-        return {
-            "total_files": len(files),
-            "total_size": total_size,
-            "by_source": by_source,
-            "by_extension": by_extension,
-        }
+        return self._get_store(job_id).stats()
 
 
 # Singleton
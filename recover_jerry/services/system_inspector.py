@@ -1,5 +1,6 @@
 """Detect volumes, snapshots, Time Machine, and permissions."""
 
+import asyncio
 import logging
 import shutil
 from pathlib import Path
@@ -12,15 +13,35 @@ from ..scanners.registry import get_all_scanners
 logger = logging.getLogger(__name__)
 
 
-async def inspect_system() -> SystemInfo:
-    """Gather full system info for the dashboard."""
-    hostname = await get_hostname()
-    os_version = await get_os_version()
-    sudo_cached = await check_sudo_cached()
-    fda = await check_full_disk_access()
+async def _scanner_availability(scanner, force_refresh: bool) -> SourceAvailability:
+    try:
+        return await scanner.check_availability_cached(force_refresh=force_refresh)
+    except Exception as e:
+        logger.warning(f"Scanner {scanner.source_id} availability check failed: {e}")
+        return SourceAvailability(
+            source_id=scanner.source_id,
+            name=scanner.name,
+            available=False,
+            requires_sudo=scanner.requires_sudo,
+            detail=f"Availability check failed: {e}",
+        )
+
+
+async def inspect_system(force_refresh: bool = False) -> SystemInfo:
+    """Gather full system info for the dashboard.
+
+    All probes are subprocess or filesystem waits of 5-100ms each, so
+    they fan out concurrently — load time is the slowest probe, not the
+    sum of all of them.
+    """
+    hostname, os_version, sudo_cached, fda, raw_volumes = await asyncio.gather(
+        get_hostname(),
+        get_os_version(),
+        check_sudo_cached(),
+        check_full_disk_access(),
+        list_diskutil_volumes(),
+    )
 
-    # Get volumes
-    raw_volumes = await list_diskutil_volumes()
     volumes = []
     for rv in raw_volumes:
         mp = rv.get("mount_point", "")
@@ -30,23 +51,13 @@ async def inspect_system() -> SystemInfo:
             is_boot=(mp == "/"),
         ))
 
-    # Check each scanner's availability
+    # Check each scanner's availability concurrently
     scanners = get_all_scanners()
-    sources = []
-    for scanner in scanners.values():
-        try:
-            avail = await scanner.check_availability()
-            avail.has_sudo = sudo_cached
-        except Exception as e:
-            logger.warning(f"Scanner {scanner.source_id} availability check failed: {e}")
-            avail = SourceAvailability(
-                source_id=scanner.source_id,
-                name=scanner.name,
-                available=False,
-                requires_sudo=scanner.requires_sudo,
-                detail=f"Availability check failed: {e}",
-            )
-        sources.append(avail)
+    sources = list(await asyncio.gather(
+        *(_scanner_availability(s, force_refresh) for s in scanners.values())
+    ))
+    for avail in sources:
+        avail.has_sudo = sudo_cached
 
     return SystemInfo(
         hostname=hostname,
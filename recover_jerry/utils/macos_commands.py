@@ -1,9 +1,23 @@
 """Wrappers for macOS system commands."""
 
 import asyncio
+import functools
+import os
 import platform
+import re
+import socket
 from typing import Optional
 
+# tmutil snapshot lines look like com.apple.TimeMachine.2024-01-01-120000
+# (or a bare dotted name); the "Snapshots for ..." banner is the only
+# other dotted line it prints
+_TMUTIL_SNAP_RE = re.compile(r"^(?!Snapshots).*\.")
+
+# Bound concurrent fork/exec: gathered callers (inspect_system, the
+# snapshot pipeline) could otherwise spawn an unbounded burst of
+# subprocesses at once.
+_RUN_CMD_SEM = asyncio.Semaphore(16)
+
 
 async def run_cmd(
     *args: str,
@@ -28,20 +42,21 @@ async def run_cmd(
         else:
             cmd = ["sudo", "-n"] + cmd
 
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdin=asyncio.subprocess.PIPE if stdin_data else None,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    try:
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(input=stdin_data), timeout=timeout,
+    async with _RUN_CMD_SEM:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if stdin_data else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-    except asyncio.TimeoutError:
-        proc.kill()
-        await proc.wait()
-        return -1, "", "Command timed out"
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(input=stdin_data), timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return -1, "", "Command timed out"
 
     return (
         proc.returncode or 0,
@@ -50,57 +65,58 @@ async def run_cmd(
     )
 
 
-async def get_hostname() -> str:
-    rc, out, _ = await run_cmd("hostname")
-    return out if rc == 0 else "unknown"
+# Neither value changes while the server runs; resolve once instead of
+# forking hostname (or re-parsing the SystemVersion plist) per call
+@functools.cache
+def _hostname() -> str:
+    try:
+        return socket.gethostname() or "unknown"
+    except OSError:
+        return "unknown"
 
 
-async def get_os_version() -> str:
+@functools.cache
+def _os_version() -> str:
     return f"macOS {platform.mac_ver()[0]}"
 
 
-async def list_local_snapshots(volume: str = "/") -> list[str]:
-    """List APFS local snapshots via tmutil, falling back to diskutil."""
-    snapshots = []
+async def get_hostname() -> str:
+    return _hostname()
 
-    # Try tmutil first (works without sudo)
-    rc, out, _ = await run_cmd("tmutil", "listlocalsnapshots", volume)
-    if rc == 0 and out:
-        for line in out.splitlines():
-            line = line.strip()
-            if line.startswith("com.apple."):
-                snapshots.append(line)
-            elif "." in line and not line.startswith("Snapshots"):
-                snapshots.append(line)
 
-    if snapshots:
-        return snapshots
+async def get_os_version() -> str:
+    return _os_version()
+
+
+def _parse_tmutil_snapshots(out: str) -> list[str]:
+    return [
+        line for line in map(str.strip, out.splitlines())
+        if _TMUTIL_SNAP_RE.match(line)
+    ]
 
-    # Try tmutil with sudo
-    rc, out, _ = await run_cmd("tmutil", "listlocalsnapshots", volume, sudo=True)
-    if rc == 0 and out:
-        for line in out.splitlines():
-            line = line.strip()
-            if line.startswith("com.apple."):
-                snapshots.append(line)
-            elif "." in line and not line.startswith("Snapshots"):
-                snapshots.append(line)
 
-    if snapshots:
-        return snapshots
+async def list_local_snapshots(volume: str = "/") -> list[str]:
+    """List APFS local snapshots via tmutil, falling back to diskutil."""
+    # Without sudo first, then with cached sudo creds
+    for sudo in (False, True):
+        rc, out, _ = await run_cmd("tmutil", "listlocalsnapshots", volume, sudo=sudo)
+        if rc == 0 and out:
+            snapshots = _parse_tmutil_snapshots(out)
+            if snapshots:
+                return snapshots
 
     # Fallback: try diskutil apfs listsnapshots on the data volume
+    snapshots = []
     rc, out, _ = await run_cmd("diskutil", "apfs", "listSnapshots", "/")
     if rc == 0 and out:
-        for line in out.splitlines():
-            line = line.strip()
-            if "com.apple." in line:
-                # Extract snapshot name from diskutil output
-                if "Name:" in line:
-                    name = line.split("Name:")[-1].strip()
-                    snapshots.append(name)
-                elif line.startswith("com.apple."):
-                    snapshots.append(line)
+        for line in map(str.strip, out.splitlines()):
+            if "com.apple." not in line:
+                continue
+            # Extract snapshot name from diskutil output
+            if "Name:" in line:
+                snapshots.append(line.split("Name:")[-1].strip())
+            elif line.startswith("com.apple."):
+                snapshots.append(line)
 
     return snapshots
 
@@ -130,25 +146,41 @@ async def unmount_snapshot(mount_point: str) -> tuple[bool, str]:
 
 
 async def list_diskutil_volumes() -> list[dict]:
-    """List volumes via diskutil."""
-    rc, out, _ = await run_cmd("diskutil", "list", "-plist")
-    # Simplified: just use df for volume info
-    rc, out, _ = await run_cmd("df", "-h")
-    if rc != 0:
-        return []
-    volumes = []
-    for line in out.splitlines()[1:]:
-        parts = line.split()
-        if len(parts) >= 6:
-            mount = parts[-1]
+    """List mounted volumes with statvfs — no subprocess.
+
+    The root volume plus whatever is mounted under /Volumes covers the
+    user-visible set; the old df -h fork (and a discarded diskutil
+    call) cost two spawns plus text parsing per dashboard load.
+    """
+    def _collect() -> list[dict]:
+        mounts = ["/"]
+        try:
+            with os.scandir("/Volumes") as it:
+                for entry in it:
+                    # follow_symlinks=False skips the "Macintosh HD"
+                    # symlink back to /, avoiding a duplicate
+                    if entry.is_dir(follow_symlinks=False):
+                        mounts.append(entry.path)
+        except OSError:
+            pass
+
+        volumes = []
+        for mp in mounts:
+            try:
+                st = os.statvfs(mp)
+            except OSError:
+                continue
+            total = st.f_frsize * st.f_blocks
             volumes.append({
-                "device": parts[0],
-                "mount_point": mount,
-                "size": parts[1],
-                "used": parts[2],
-                "available": parts[3],
+                "device": "",
+                "mount_point": mp,
+                "size": total,
+                "used": total - st.f_frsize * st.f_bfree,
+                "available": st.f_frsize * st.f_bavail,
             })
-    return volumes
+        return volumes
+
+    return await asyncio.to_thread(_collect)
 
 
 async def get_tm_destination() -> Optional[str]:
@@ -2,11 +2,45 @@
 
 import asyncio
 import os
+import time
 from pathlib import Path
+from typing import Optional
+
+# Both probes fork a subprocess or touch ~/Library and get called on
+# every dashboard refresh; a short TTL collapses polling bursts, and
+# the lock coalesces concurrent first callers into one probe.
+_PERM_CACHE_TTL = 5.0
+_sudo_cache: Optional[tuple[float, bool]] = None
+_sudo_lock = asyncio.Lock()
+_fda_cache: Optional[tuple[float, bool]] = None
+_fda_lock = asyncio.Lock()
+
+
+def invalidate_permission_caches() -> None:
+    """Drop cached probe results after a known state change.
+
+    Called after sudo authentication so the next inspect_system
+    re-probes instead of serving a pre-auth False for up to the TTL.
+    """
+    global _sudo_cache, _fda_cache
+    _sudo_cache = None
+    _fda_cache = None
 
 
 async def check_sudo_cached() -> bool:
     """Check if sudo credentials are cached (non-interactive)."""
+    global _sudo_cache
+    if _sudo_cache is not None and time.monotonic() - _sudo_cache[0] < _PERM_CACHE_TTL:
+        return _sudo_cache[1]
+    async with _sudo_lock:
+        if _sudo_cache is not None and time.monotonic() - _sudo_cache[0] < _PERM_CACHE_TTL:
+            return _sudo_cache[1]
+        result = await _probe_sudo()
+        _sudo_cache = (time.monotonic(), result)
+        return result
+
+
+async def _probe_sudo() -> bool:
     try:
         proc = await asyncio.create_subprocess_exec(
             "sudo", "-n", "true",
@@ -21,17 +55,40 @@ async def check_sudo_cached() -> bool:
 
 async def check_full_disk_access() -> bool:
     """Heuristic: try reading a FDA-protected path."""
+    global _fda_cache
+    if _fda_cache is not None and time.monotonic() - _fda_cache[0] < _PERM_CACHE_TTL:
+        return _fda_cache[1]
+    async with _fda_lock:
+        if _fda_cache is not None and time.monotonic() - _fda_cache[0] < _PERM_CACHE_TTL:
+            return _fda_cache[1]
+        result = await _probe_full_disk_access()
+        _fda_cache = (time.monotonic(), result)
+        return result
+
+
+async def _probe_full_disk_access() -> bool:
     test_paths = [
         Path.home() / "Library" / "Mail",
         Path.home() / "Library" / "Safari",
     ]
-    for p in test_paths:
+
+    def _peek(p: Path) -> Optional[bool]:
+        # Reading one entry answers the permission question; listing
+        # the whole directory (thousands of entries under Mail) blocked
+        # the event loop for no extra information. None = path missing.
         try:
-            if p.exists():
-                list(p.iterdir())
-                return True
+            with os.scandir(p) as it:
+                next(it, None)
+            return True
         except PermissionError:
             return False
+        except OSError:
+            return None
+
+    for p in test_paths:
+        result = await asyncio.to_thread(_peek, p)
+        if result is not None:
+            return result
     return True  # if test paths don't exist, assume OK
 
 
@@ -0,0 +1,15 @@
+"""Timestamp helpers for hot scan loops."""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def dt_from_ts(ts: float) -> datetime:
+    """UTC datetime for an epoch timestamp, cached.
+
+    Ingest loops build up to two datetime objects per file, and carved
+    or backed-up output repeats timestamps heavily (files are written in
+    bursts), so a small cache eliminates most of the allocations.
+    """
+    return datetime.fromtimestamp(ts, tz=timezone.utc)